@@ -16,16 +16,18 @@ Shape factory and drawing helpers. We generate a palette of distinct visual symb
 on a Tkinter Canvas. No external image assets required.
 
 Usage:
-- Each shape type is represented by a callable: draw_shape(canvas, x, y, size)
-- Identity of a tile is (shape_name, color_name).
+- Each shape type is represented by a callable: draw_shape(canvas, x, y, size), which returns
+  the ids of the canvas items it created.
+- Identity of a tile is an index into IDENTITY_TABLE, which maps to (shape_name, color_name).
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Tuple
+from math import cos, pi, sin
+from typing import Callable, List, Tuple
 
 
-DrawFn = Callable[["Canvas", float, float, float, str], None]
+DrawFn = Callable[["Canvas", float, float, float, str], List[int]]
 
 
 @dataclass(frozen=True)
@@ -36,69 +38,78 @@ class Glyph:
 
 # --- Drawing primitives -----------------------------------------------------------------------------
 
+def _polar(r, ang):
+    return r * cos(ang), r * sin(ang)
+
+
+# Star (10 alternating outer/inner points) and hexagon vertices for a glyph of size 1;
+# drawing only scales and translates them
+_STAR_UNIT = tuple(_polar(0.42 if i % 2 == 0 else 0.21, -pi / 2 + i * pi / 5) for i in range(10))
+_HEX_UNIT = tuple(_polar(0.42, pi / 6 + k * pi / 3) for k in range(6))
+
+
+def create_item(canvas, kind, coords, fill, tags=None):
+    """Create a borderless canvas item with a single Tcl call and return its id."""
+    # Issue the Tcl command directly; Canvas.create_* re-parses options and flattens args per call
+    args = (canvas._w, "create", kind, *coords, "-fill", fill, "-width", 0)
+    if tags is not None:
+        args += ("-tags", tags)
+    return canvas.tk.getint(canvas.tk.call(*args))
+
+
 def _draw_circle(canvas, cx, cy, s, fill):
     r = s * 0.34
-    canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill=fill, width=0)
+    return [create_item(canvas, "oval", (cx - r, cy - r, cx + r, cy + r), fill)]
 
 
 def _draw_square(canvas, cx, cy, s, fill):
     r = s * 0.34
-    canvas.create_rectangle(cx - r, cy - r, cx + r, cy + r, fill=fill, width=0)
+    return [create_item(canvas, "rectangle", (cx - r, cy - r, cx + r, cy + r), fill)]
 
 
 def _draw_diamond(canvas, cx, cy, s, fill):
     r = s * 0.42
     pts = [cx, cy - r, cx + r, cy, cx, cy + r, cx - r, cy]
-    canvas.create_polygon(pts, fill=fill, width=0)
+    return [create_item(canvas, "polygon", pts, fill)]
 
 
 def _draw_triangle(canvas, cx, cy, s, fill):
     r = s * 0.42
     pts = [cx, cy - r, cx + r, cy + r, cx - r, cy + r]
-    canvas.create_polygon(pts, fill=fill, width=0)
+    return [create_item(canvas, "polygon", pts, fill)]
 
 
 def _draw_star(canvas, cx, cy, s, fill):
-    r1 = s * 0.42
-    r2 = r1 * 0.5
-    pts = []
-    for i in range(10):
-        from math import cos, sin, pi
-
-        ang = -pi / 2 + i * pi / 5
-        r = r1 if i % 2 == 0 else r2
-        pts.extend([cx + r * cos(ang), cy + r * sin(ang)])
-    canvas.create_polygon(pts, fill=fill, width=0)
+    pts = [v for dx, dy in _STAR_UNIT for v in (cx + dx * s, cy + dy * s)]
+    return [create_item(canvas, "polygon", pts, fill)]
 
 
 def _draw_plus(canvas, cx, cy, s, fill):
     w = s * 0.18
     r = s * 0.42
-    canvas.create_rectangle(cx - w, cy - r, cx + w, cy + r, fill=fill, width=0)
-    canvas.create_rectangle(cx - r, cy - w, cx + r, cy + w, fill=fill, width=0)
+    return [
+        create_item(canvas, "rectangle", (cx - w, cy - r, cx + w, cy + r), fill),
+        create_item(canvas, "rectangle", (cx - r, cy - w, cx + r, cy + w), fill),
+    ]
 
 
 def _draw_cross(canvas, cx, cy, s, fill):
     w = s * 0.18
     r = s * 0.42
     # Diagonal rectangles for an X
-    canvas.create_polygon(
-        cx - r, cy - r + w, cx - r + w, cy - r, cx + r, cy + r - w, cx + r - w, cy + r, fill=fill, width=0
-    )
-    canvas.create_polygon(
-        cx + r, cy - r + w, cx + r - w, cy - r, cx - r, cy + r - w, cx - r + w, cy + r, fill=fill, width=0
-    )
+    return [
+        create_item(
+            canvas, "polygon", (cx - r, cy - r + w, cx - r + w, cy - r, cx + r, cy + r - w, cx + r - w, cy + r), fill
+        ),
+        create_item(
+            canvas, "polygon", (cx + r, cy - r + w, cx + r - w, cy - r, cx - r, cy + r - w, cx - r + w, cy + r), fill
+        ),
+    ]
 
 
 def _draw_hexagon(canvas, cx, cy, s, fill):
-    from math import cos, sin, pi
-
-    r = s * 0.42
-    pts = []
-    for k in range(6):
-        ang = pi / 6 + k * pi / 3
-        pts.extend([cx + r * cos(ang), cy + r * sin(ang)])
-    canvas.create_polygon(pts, fill=fill, width=0)
+    pts = [v for dx, dy in _HEX_UNIT for v in (cx + dx * s, cy + dy * s)]
+    return [create_item(canvas, "polygon", pts, fill)]
 
 
 GLYPHS = [
@@ -131,8 +142,21 @@ def available_identities():
     return [(g.name, c) for g in GLYPHS for c in PALETTE]
 
 
-def draw_identity(canvas, cx, cy, size, identity):
-    """Draw a given identity (shape_name, color) centered at (cx, cy)."""
-    name, color = identity
-    glyph = next(g for g in GLYPHS if g.name == name)
-    glyph.draw(canvas, cx, cy, size, color)
+# Tiles store indices into this table; Board.identity_of resolves them to (glyph_name, color_hex)
+IDENTITY_TABLE = tuple(available_identities())
+
+
+def _bind_fill(draw, fill):
+    def draw_filled(canvas, cx, cy, s):
+        return draw(canvas, cx, cy, s, fill)
+
+    return draw_filled
+
+
+# One pre-bound draw callable per IDENTITY_TABLE index (same glyph-major order)
+_DRAW_BY_ID = tuple(_bind_fill(g.draw, c) for g in GLYPHS for c in PALETTE)
+
+
+def draw_identity_id(canvas, cx, cy, size, identity_id):
+    """Draw the identity at IDENTITY_TABLE[identity_id] centered at (cx, cy) and return its item ids."""
+    return _DRAW_BY_ID[identity_id](canvas, cx, cy, size)
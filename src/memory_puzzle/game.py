@@ -22,7 +22,7 @@ from random import Random
 from typing import List, Optional, Sequence, Tuple
 
 from . import __version__
-from .assets import available_identities
+from .assets import IDENTITY_TABLE
 from .settings import LevelConfig, DEFAULT_SEED
 
 Identity = Tuple[str, str]  # (shape_name, color_hex)
@@ -30,11 +30,15 @@ Identity = Tuple[str, str]  # (shape_name, color_hex)
 
 @dataclass
 class Tile:
+    # Explicit slots (no per-tile __dict__); dataclass(slots=True) needs Python 3.10,
+    # and manual slots cannot coexist with field defaults, so all fields are required.
+    __slots__ = ("row", "col", "identity", "revealed", "matched")
+
     row: int
     col: int
-    identity: Identity
-    revealed: bool = False
-    matched: bool = False
+    identity: int  # index into IDENTITY_TABLE, so matching is a plain int compare
+    revealed: bool
+    matched: bool
 
 
 class Board:
@@ -43,6 +47,7 @@ class Board:
         self.rows, self.cols = level.rows, level.cols
         self.rng = Random(seed)
         self.grid: List[List[Tile]] = []
+        self._flat: List[Tile] = []
         self.moves = 0
         self.matched_pairs = 0
         self._first_selection: Optional[Tile] = None
@@ -54,14 +59,21 @@ class Board:
         assert num_tiles % 2 == 0, "Board must have an even number of tiles"
         needed_pairs = num_tiles // 2
 
-        ids = available_identities()
-        if needed_pairs > len(ids):
+        if needed_pairs > len(IDENTITY_TABLE):
             raise ValueError("Not enough unique identities for the requested board size.")
 
-        # Pick identities and duplicate to make pairs
-        chosen = self.rng.sample(ids, needed_pairs)
-        pool: List[Identity] = [*chosen, *chosen]
-        self.rng.shuffle(pool)
+        # Pick identities with a partial Fisher–Yates, duplicate them to make pairs,
+        # then shuffle the whole pool in place with a full Fisher–Yates
+        rng = self.rng
+        ids = list(range(len(IDENTITY_TABLE)))
+        pool: List[int] = [0] * num_tiles
+        for i in range(needed_pairs):
+            j = rng.randrange(i, len(ids))
+            ids[i], ids[j] = ids[j], ids[i]
+            pool[i] = pool[needed_pairs + i] = ids[i]
+        for i in range(num_tiles - 1, 0, -1):
+            j = rng.randrange(i + 1)
+            pool[i], pool[j] = pool[j], pool[i]
 
         # Fill the grid
         self.grid = []
@@ -69,14 +81,20 @@ class Board:
         for r in range(self.rows):
             row_tiles: List[Tile] = []
             for c in range(self.cols):
-                row_tiles.append(Tile(r, c, pool[k]))
+                row_tiles.append(Tile(r, c, pool[k], False, False))
                 k += 1
             self.grid.append(row_tiles)
+        # Row-major view of the same tiles, iterated on every UI refresh
+        self._flat = [t for row in self.grid for t in row]
 
     # --- Queries ----------------------------------------------------------------------
     def tile(self, row: int, col: int) -> Tile:
         return self.grid[row][col]
 
+    def identity_of(self, tile: Tile) -> Identity:
+        """Resolve a tile's identity index to its (shape_name, color_hex) pair."""
+        return IDENTITY_TABLE[tile.identity]
+
     def all_revealed(self) -> bool:
         return self.matched_pairs * 2 == self.rows * self.cols
 
@@ -121,9 +139,7 @@ class Board:
         b.revealed = False
 
     def for_each(self) -> Sequence[Tile]:
-        for r in range(self.rows):
-            for c in range(self.cols):
-                yield self.grid[r][c]
+        return self._flat
 
 
 __all__ = ["Board", "Tile", "Identity"]
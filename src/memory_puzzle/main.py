@@ -19,22 +19,52 @@ memory-puzzle  # via console_script entry point
 """
 from __future__ import annotations
 
-import argparse
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from .ui import MemoryApp
 
+if TYPE_CHECKING:
+    import argparse
+
+LEVEL_NAMES = ("easy", "medium", "hard")
+
+
+def _build_parser():
+    # Only needed for --help and error reporting, so argparse is imported lazily
+    import argparse
 
-def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Tkinter Memory Puzzle Game")
-    p.add_argument("--level", choices=["easy", "medium", "hard"], default="easy", help="Board difficulty")
+    p.add_argument("--level", choices=LEVEL_NAMES, default="easy", help="Board difficulty")
     p.add_argument("--seed", type=int, default=None, help="Deterministic RNG seed (for testing)")
-    return p.parse_args()
+    return p
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Union[SimpleNamespace, argparse.Namespace]:
+    argv = sys.argv[1:] if argv is None else argv
+    args = {"level": "easy", "seed": None}
+    it = iter(argv)
+    try:
+        for a in it:
+            if a == "--level":
+                args["level"] = next(it)
+                if args["level"] not in LEVEL_NAMES:
+                    raise ValueError(args["level"])
+            elif a == "--seed":
+                args["seed"] = int(next(it))
+            else:
+                raise ValueError(a)
+    except (StopIteration, ValueError):
+        # Anything beyond the two plain flags (-h, --level=hard, typos, bad values)
+        # goes through argparse for the usual help and error messages
+        return _build_parser().parse_args(argv)
+    return SimpleNamespace(**args)
 
 
 def main() -> None:
     args = parse_args()
-    level_map = {"easy": 0, "medium": 1, "hard": 2}
-    app = MemoryApp(level_index=level_map[args.level], seed=args.seed)
+    app = MemoryApp(level_index=LEVEL_NAMES.index(args.level), seed=args.seed)
     app.mainloop()
 
 
@@ -40,6 +40,7 @@ HUD_HEIGHT = 60
 
 # Delays (ms)
 MISMATCH_HIDE_DELAY = 650
+MOTION_THROTTLE_MS = 16  # ~one hover update per frame at 60 Hz
 
 # Colors
 BG_COLOR = "#0f172a"  # slate-900
@@ -18,9 +18,9 @@ from __future__ import annotations
 import time
 import tkinter as tk
 from tkinter import messagebox
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from .assets import draw_identity
+from .assets import create_item, draw_identity_id
 from .game import Board, Tile
 from .settings import (
     BG_COLOR,
@@ -29,6 +29,7 @@ from .settings import (
     HUD_HEIGHT,
     LEVELS,
     MISMATCH_HIDE_DELAY,
+    MOTION_THROTTLE_MS,
     PADDING,
     TILE_BG,
     TILE_GAP,
@@ -38,6 +39,8 @@ from .settings import (
     TILE_SIZE,
 )
 
+TileGeom = Tuple[int, int, int, int, int, int]  # (x0, y0, x1, y1, cx, cy)
+
 
 class MemoryApp(tk.Tk):
     def __init__(self, level_index: int = 0, seed: Optional[int] = None) -> None:
@@ -56,14 +59,28 @@ class MemoryApp(tk.Tk):
 
         # Widgets
         self.canvas = tk.Canvas(self, width=self.canvas_width, height=self.canvas_height, bg=CANVAS_BG, highlightthickness=0)
-        self.canvas.pack()
 
         self._hover_tile: Optional[Tuple[int, int]] = None
         self._pending_hide: Optional[Tuple[Tile, Tile]] = None
+        # Motion events are coalesced: only the latest position is processed, at most once per frame
+        self._motion_xy: Tuple[int, int] = (-1, -1)
+        self._motion_pending = False
+        self._last_motion_ts = 0.0
+        self._last_elapsed = -1
+        self._rects: List[List[TileGeom]] = []
+        # Persistent canvas items: one rectangle per tile, glyph items created on first reveal
+        # and kept (hidden while face down) for the rest of the game
+        self._tile_rect_ids: List[List[int]] = []
+        self._tile_states: List[List[str]] = []
+        self._glyph_items: Dict[Tuple[int, int], List[int]] = {}
 
         self._bind_keys()
+        self._layout()
         self._draw_static()
+        self._draw_tiles()
         self._redraw_all()
+        # Map the canvas only once the initial board is fully drawn
+        self.canvas.pack()
         self._tick()
 
     # --- Input -----------------------------------------------------------------------
@@ -77,14 +94,21 @@ class MemoryApp(tk.Tk):
         self.bind("<Key-h>", lambda e: self.new_game(2))
 
     # --- Layout & drawing ------------------------------------------------------------
-    def _tile_rect(self, r: int, c: int) -> Tuple[int, int, int, int]:
-        x0 = PADDING + c * (TILE_SIZE + TILE_GAP)
-        y0 = HUD_HEIGHT + PADDING + r * (TILE_SIZE + TILE_GAP)
-        return x0, y0, x0 + TILE_SIZE, y0 + TILE_SIZE
+    def _layout(self) -> None:
+        # Tile geometry only depends on the board size, so compute it once per game
+        step = TILE_SIZE + TILE_GAP
+        half = TILE_SIZE // 2
+        self._rects = []
+        for r in range(self.board.rows):
+            y0 = HUD_HEIGHT + PADDING + r * step
+            row: List[TileGeom] = []
+            for c in range(self.board.cols):
+                x0 = PADDING + c * step
+                row.append((x0, y0, x0 + TILE_SIZE, y0 + TILE_SIZE, x0 + half, y0 + half))
+            self._rects.append(row)
 
     def _tile_center(self, r: int, c: int) -> Tuple[int, int]:
-        x0, y0, x1, y1 = self._tile_rect(r, c)
-        return (x0 + x1) // 2, (y0 + y1) // 2
+        return self._rects[r][c][4:]
 
     def _draw_static(self) -> None:
         # HUD background
@@ -94,25 +118,56 @@ class MemoryApp(tk.Tk):
         self.hud_moves = self.canvas.create_text(self.canvas_width // 2, HUD_HEIGHT // 2, anchor="center", fill="white", font=FONT_HUD, text="")
         self.hud_time = self.canvas.create_text(self.canvas_width - 10, HUD_HEIGHT // 2, anchor="e", fill="white", font=FONT_HUD, text="")
 
+    def _draw_tiles(self) -> None:
+        # Create every tile rectangle once; later updates only reconfigure them
+        self._tile_rect_ids = []
+        self._tile_states = []
+        self._glyph_items = {}
+        for row in self._rects:
+            ids: List[int] = []
+            for x0, y0, x1, y1, _, _ in row:
+                ids.append(create_item(self.canvas, "rectangle", (x0, y0, x1, y1), TILE_BG, tags="tile"))
+            self._tile_rect_ids.append(ids)
+            self._tile_states.append([TILE_BG] * len(row))
+
+    def _tile_fill(self, t: Tile) -> str:
+        if t.matched:
+            return TILE_MATCHED
+        if t.revealed:
+            return TILE_REVEALED
+        if self._hover_tile == (t.row, t.col):
+            return TILE_HOVER
+        return TILE_BG
+
+    def _set_tile_state(self, r: int, c: int, state: str) -> None:
+        # state is the tile background color; Tk is only touched when it actually changes
+        prev = self._tile_states[r][c]
+        if prev == state:
+            return
+        self._tile_states[r][c] = state
+        self.canvas.itemconfigure(self._tile_rect_ids[r][c], fill=state)
+
+        # glyph if revealed or matched: drawn on first reveal, then only shown/hidden
+        face_up = state in (TILE_REVEALED, TILE_MATCHED)
+        if face_up == (prev in (TILE_REVEALED, TILE_MATCHED)):
+            return
+        glyph = self._glyph_items.get((r, c))
+        if glyph is None:
+            cx, cy = self._tile_center(r, c)
+            identity = self.board.tile(r, c).identity
+            self._glyph_items[(r, c)] = draw_identity_id(self.canvas, cx, cy, TILE_SIZE, identity)
+            return
+        visibility = "normal" if face_up else "hidden"
+        for item in glyph:
+            self.canvas.itemconfigure(item, state=visibility)
+
+    def _update_tile(self, r: int, c: int) -> None:
+        self._set_tile_state(r, c, self._tile_fill(self.board.tile(r, c)))
+
     def _redraw_all(self) -> None:
-        self.canvas.delete("tile")
         # Tiles
         for t in self.board.for_each():
-            x0, y0, x1, y1 = self._tile_rect(t.row, t.col)
-            # background
-            fill = TILE_BG
-            if t.matched:
-                fill = TILE_MATCHED
-            elif t.revealed:
-                fill = TILE_REVEALED
-            elif self._hover_tile == (t.row, t.col):
-                fill = TILE_HOVER
-            self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill, width=0, tags=("tile", f"tile-{t.row}-{t.col}"))
-
-            # glyph if revealed or matched
-            if t.revealed or t.matched:
-                cx, cy = self._tile_center(t.row, t.col)
-                draw_identity(self.canvas, cx, cy, TILE_SIZE, t.identity)
+            self._set_tile_state(t.row, t.col, self._tile_fill(t))
 
         # HUD data
         level_name = f"Level: {self.board.level.name}  ({self.board.rows}×{self.board.cols})"
@@ -120,14 +175,33 @@ class MemoryApp(tk.Tk):
         self.canvas.itemconfigure(self.hud_moves, text=f"Moves: {self.board.moves}")
         elapsed = int(time.time() - self.start_time)
         self.canvas.itemconfigure(self.hud_time, text=f"Time: {elapsed}s")
+        self._last_elapsed = elapsed
 
     # --- Game flow -------------------------------------------------------------------
     def _on_motion(self, event) -> None:
-        r, c = self._hit_test(event.x, event.y)
+        self._motion_xy = (event.x, event.y)
+        if self._motion_pending:
+            return
+        self._motion_pending = True
+        wait_ms = int(MOTION_THROTTLE_MS - (time.monotonic() - self._last_motion_ts) * 1000)
+        if wait_ms > 0:
+            self.after(wait_ms, self._process_motion)
+        else:
+            self.after_idle(self._process_motion)
+
+    def _process_motion(self) -> None:
+        self._motion_pending = False
+        self._last_motion_ts = time.monotonic()
+        r, c = self._hit_test(*self._motion_xy)
         prev = self._hover_tile
         self._hover_tile = (r, c) if r is not None else None
-        if self._hover_tile != prev:
-            self._redraw_all()
+        if self._hover_tile == prev:
+            return
+        # Only the tiles entering/leaving hover can change
+        if prev is not None:
+            self._update_tile(*prev)
+        if self._hover_tile is not None:
+            self._update_tile(*self._hover_tile)
 
     def _on_click(self, event) -> None:
         if self._pending_hide is not None:
@@ -154,14 +228,24 @@ class MemoryApp(tk.Tk):
         a, b = self._pending_hide
         self._pending_hide = None
         self.board.hide_unmatched(a, b)
-        self._redraw_all()
+        # Only these two tiles flip back: recolor them and hide their (kept) glyph items
+        self._update_tile(a.row, a.col)
+        self._update_tile(b.row, b.col)
 
     def _hit_test(self, x: int, y: int) -> Tuple[Optional[int], Optional[int]]:
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                x0, y0, x1, y1 = self._tile_rect(r, c)
-                if x0 <= x <= x1 and y0 <= y <= y1:
-                    return r, c
+        # The grid is regular: the cell follows from integer division, the remainder rejects gaps
+        x -= PADDING
+        y -= HUD_HEIGHT + PADDING
+        step = TILE_SIZE + TILE_GAP
+        c = x // step
+        r = y // step
+        if (
+            0 <= r < self.board.rows
+            and 0 <= c < self.board.cols
+            and x - c * step <= TILE_SIZE
+            and y - r * step <= TILE_SIZE
+        ):
+            return r, c
         return None, None
 
     def _maybe_finish(self) -> None:
@@ -185,12 +269,16 @@ class MemoryApp(tk.Tk):
         self.canvas_width = PADDING * 2 + self.board.cols * TILE_SIZE + (self.board.cols - 1) * TILE_GAP
         self.canvas_height = HUD_HEIGHT + PADDING * 2 + self.board.rows * TILE_SIZE + (self.board.rows - 1) * TILE_GAP
         self.canvas.config(width=self.canvas_width, height=self.canvas_height)
+        self._layout()
         self.canvas.delete("all")
         self._draw_static()
+        self._draw_tiles()
         self._redraw_all()
 
     def _tick(self):
-        # Update only the HUD time every 250ms
+        # Update only the HUD time every 250ms (never the board), and only when the second changes
         elapsed = int(time.time() - self.start_time)
-        self.canvas.itemconfigure(self.hud_time, text=f"Time: {elapsed}s")
+        if elapsed != self._last_elapsed:
+            self._last_elapsed = elapsed
+            self.canvas.itemconfigure(self.hud_time, text=f"Time: {elapsed}s")
         self.after(250, self._tick)
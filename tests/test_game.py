@@ -16,9 +16,12 @@ Unit tests for pure game logic (no GUI dependencies).
 from __future__ import annotations
 
 import itertools
+import time
+from collections import Counter
 
 import pytest
 
+from memory_puzzle.assets import IDENTITY_TABLE
 from memory_puzzle.game import Board
 from memory_puzzle.settings import EASY, MEDIUM, HARD
 
@@ -29,10 +32,28 @@ def test_board_pairing(level):
     identities = [(t.identity) for t in b.for_each()]
     assert len(identities) == level.rows * level.cols
     # Each identity appears exactly twice
-    counts = {k: identities.count(k) for k in set(identities)}
+    counts = Counter(identities)
     assert all(v == 2 for v in counts.values())
 
 
+def test_identity_of_resolves_table():
+    b = Board(HARD, seed=3)
+    tiles = list(b.for_each())
+    assert all(t.identity in range(len(IDENTITY_TABLE)) for t in tiles)
+    for a, c in itertools.combinations(tiles, 2):
+        same_pair = b.identity_of(a) == b.identity_of(c)
+        assert same_pair == (a.identity == c.identity)
+    shape, color = b.identity_of(tiles[0])
+    assert isinstance(shape, str) and color.startswith("#")
+
+
+def test_tiles_are_slotted():
+    t = Board(EASY, seed=5).tile(0, 0)
+    assert not hasattr(t, "__dict__")
+    with pytest.raises(AttributeError):
+        t.flipped = True
+
+
 def test_moves_and_matching():
     b = Board(EASY, seed=123)
     # Build lookup from identity to positions
@@ -69,3 +90,32 @@ def test_mismatch_then_hide():
     assert second is not None and not matched
     b.hide_unmatched(first, second)
     assert not first.revealed and not second.revealed
+
+
+def _mismatch_loop(b, n):
+    tiles = list(b.for_each())
+    a = tiles[0]
+    other = next(t for t in tiles if t.identity != a.identity)
+    for _ in range(n):
+        b.reveal(a.row, a.col)
+        b.reveal(other.row, other.col)
+        b.hide_unmatched(a, other)
+
+
+def test_repeated_mismatch_counts_moves():
+    b = Board(HARD, seed=11)
+    _mismatch_loop(b, 100)
+    assert b.moves == 100
+    assert b.matched_pairs == 0
+
+
+@pytest.mark.benchmark
+def test_reveal_benchmark():
+    b = Board(HARD, seed=11)
+    n = 20_000
+    start = time.perf_counter()
+    _mismatch_loop(b, n)
+    elapsed = time.perf_counter() - start
+    assert b.moves == n
+    # Generous budget: this is a regression guard, not a precise measurement
+    assert elapsed < 2.0
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=========================================================================================================
+Project: Memory Puzzle Game
+File: test_main.py
+Author: Mobin Yousefi (GitHub: https://github.com/mobinyousefi-cs)
+Created: 2026-10-14
+Updated: 2026-10-14
+License: MIT License (see LICENSE file for details)
+=====================================================================================================
+
+Description:
+Unit tests for command-line parsing (no window is created).
+"""
+from __future__ import annotations
+
+import pytest
+
+from memory_puzzle.main import parse_args
+
+
+def test_defaults():
+    args = parse_args([])
+    assert (args.level, args.seed) == ("easy", None)
+
+
+def test_level_and_seed():
+    args = parse_args(["--level", "hard", "--seed", "3"])
+    assert (args.level, args.seed) == ("hard", 3)
+
+
+def test_equals_form_falls_back_to_argparse():
+    args = parse_args(["--level=hard"])
+    assert (args.level, args.seed) == ("hard", None)
+
+
+@pytest.mark.parametrize("argv", [["--level", "bogus"], ["--seed"], ["--seed", "x"], ["--foo"]])
+def test_invalid_arguments_exit(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)